@@ -30,6 +30,8 @@ export declare class PythonProcessPool extends EventEmitter {
     constructor(scriptPath: string, config?: PythonPoolConfig);
     private initialize;
     private createConnection;
+    private drainFrames;
+    private logStrayOutput;
     private handleResponse;
     private handleConnectionError;
     private handleConnectionExit;
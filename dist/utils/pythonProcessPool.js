@@ -54,16 +54,9 @@ class PythonProcessPool extends events_1.EventEmitter {
                 errorCount: 0,
                 busy: false,
             };
-            let buffer = '';
+            let buffer = Buffer.alloc(0);
             pythonProcess.stdout.on('data', (data) => {
-                buffer += data.toString();
-                const lines = buffer.split('\n');
-                buffer = lines.pop() || '';
-                for (const line of lines) {
-                    if (line.trim()) {
-                        this.handleResponse(connection, line);
-                    }
-                }
+                buffer = this.drainFrames(connection, Buffer.concat([buffer, data]));
             });
             pythonProcess.stderr.on('data', (data) => {
                 console.error(`Python process ${id} stderr:`, data.toString());
@@ -92,6 +85,46 @@ class PythonProcessPool extends events_1.EventEmitter {
             return null;
         }
     }
+    drainFrames(connection, buffer) {
+        while (true) {
+            const start = buffer.indexOf('Content-Length:');
+            if (start === -1) {
+                const lastNewline = buffer.lastIndexOf('\n');
+                if (lastNewline !== -1) {
+                    this.logStrayOutput(connection, buffer.subarray(0, lastNewline + 1));
+                    buffer = buffer.subarray(lastNewline + 1);
+                }
+                return buffer;
+            }
+            if (start > 0) {
+                this.logStrayOutput(connection, buffer.subarray(0, start));
+                buffer = buffer.subarray(start);
+            }
+            const headerEnd = buffer.indexOf('\r\n\r\n');
+            if (headerEnd === -1) {
+                return buffer;
+            }
+            const match = /^Content-Length:\s*(\d+)/.exec(buffer.subarray(0, headerEnd).toString());
+            if (!match) {
+                this.logStrayOutput(connection, buffer.subarray(0, headerEnd + 4));
+                buffer = buffer.subarray(headerEnd + 4);
+                continue;
+            }
+            const bodyStart = headerEnd + 4;
+            const bodyEnd = bodyStart + parseInt(match[1], 10);
+            if (buffer.length < bodyEnd) {
+                return buffer;
+            }
+            this.handleResponse(connection, buffer.subarray(bodyStart, bodyEnd).toString('utf8'));
+            buffer = buffer.subarray(bodyEnd);
+        }
+    }
+    logStrayOutput(connection, output) {
+        const text = output.toString().trim();
+        if (text) {
+            console.warn(`Python process ${connection.id} output:`, text);
+        }
+    }
     handleResponse(connection, line) {
         try {
             const response = JSON.parse(line);
@@ -172,7 +205,9 @@ class PythonProcessPool extends events_1.EventEmitter {
                 timestamp: Date.now(),
             });
             connection.busy = true;
-            connection.process.stdin.write(JSON.stringify(request) + '\n');
+            const body = Buffer.from(JSON.stringify(request), 'utf8');
+            connection.process.stdin.write(`Content-Length: ${body.length}\r\n\r\n`);
+            connection.process.stdin.write(body);
         });
     }
     async execute(method, args = []) {
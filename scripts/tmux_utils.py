@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 
+import asyncio
+import re
+import shlex
 import subprocess
 import json
 import time
-from typing import List, Dict, Optional, Tuple
+from collections import deque
+from typing import Deque, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -20,52 +24,267 @@ class TmuxSession:
     windows: List[TmuxWindow]
     attached: bool
 
+# Hidden session that hosts the control-mode client; never reported to callers
+CONTROL_SESSION_NAME = "_orch_ctl"
+
+# Window role keywords, matched in a single pass; the group that fires picks the role
+_search_role = re.compile(r"(project|manager)|(qa|test)|(dev|code)", re.IGNORECASE).search
+_ROLE_BY_GROUP = {1: 'project-manager', 2: 'qa-engineer', 3: 'developer'}
+_ROLE_BY_INDEX = {0: 'project-manager', 1: 'qa-engineer', 2: 'developer'}
+
+def _quote_tmux_arg(arg: str) -> str:
+    """Quote an argument for the tmux command parser (single quotes, no escapes inside)"""
+    return "'" + arg.replace("'", "'\"'\"'") + "'"
+
+class TmuxControlChannel:
+    """Long-lived `tmux -C` client that runs commands without a fork/exec per call
+    
+    Commands are written one per line and answered in order with
+    %begin/%end (or %error) framed blocks carrying flag 1. Blocks with other
+    flags (the initial command line, hooks) and notifications are ignored.
+    """
+    
+    def __init__(self):
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._pending: Deque[Tuple[str, asyncio.Future]] = deque()
+        self._attached: Optional[asyncio.Future] = None
+        self.is_open = False
+    
+    async def start(self):
+        """Attach a control client to the hidden control session, creating it if needed
+        
+        This starts a tmux server if none is running. destroy-unattached is set
+        on the tmux command line, so the session cannot outlive a client that
+        dies during startup. Once the client reports the session attached it
+        is set once more over stdin; that reply confirms the client is
+        serving commands.
+        """
+        self._proc = await asyncio.create_subprocess_exec(
+            "tmux", "-C", "new-session", "-A", "-s", CONTROL_SESSION_NAME,
+            ";", "set-option", "-t", CONTROL_SESSION_NAME, "destroy-unattached", "on",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=2 ** 20  # capture-pane lines can be long
+        )
+        loop = asyncio.get_running_loop()
+        # tmux may read stdin before the command line has run, so wait for the attach
+        self._attached = loop.create_future()
+        self.is_open = True
+        self._reader = loop.create_task(self._read_responses())
+        await self._attached
+        await self.command(["set-option", "-t", CONTROL_SESSION_NAME, "destroy-unattached", "on"])
+    
+    async def command(self, args: List[str]) -> str:
+        """Run one tmux command over the channel and return its output"""
+        if not self.is_open:
+            raise ConnectionError("tmux control channel is closed")
+        
+        cmd = " ".join(_quote_tmux_arg(arg) for arg in args)
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((cmd, future))
+        self._proc.stdin.write(cmd.encode() + b"\n")
+        await self._proc.stdin.drain()
+        return await future
+    
+    async def _read_responses(self):
+        """Resolve pending commands from the client's output; never raises"""
+        block_id = None
+        block_is_reply = False
+        truncated = False
+        lines: List[str] = []
+        try:
+            while True:
+                try:
+                    raw = await self._proc.stdout.readline()
+                except ValueError:
+                    # Line longer than the stream limit; its start is lost
+                    truncated = True
+                    continue
+                if not raw:
+                    break  # Control client exited (detached or server killed)
+                line = raw.decode(errors="replace").rstrip("\n")
+                
+                if block_id is None:
+                    if line.startswith("%session-changed ") and line.split(" ", 2)[2:] == [CONTROL_SESSION_NAME]:
+                        if not self._attached.done():
+                            self._attached.set_result(None)
+                    elif line.startswith("%begin "):
+                        parts = line.split(" ")
+                        block_id = parts[2] if len(parts) == 4 else None
+                        # Only commands read from our stdin are flagged 1
+                        block_is_reply = len(parts) == 4 and parts[3] == "1"
+                        truncated = False
+                        lines = []
+                    continue
+                
+                parts = line.split(" ")
+                if len(parts) == 4 and parts[0] in ("%end", "%error") and parts[2] == block_id:
+                    if block_is_reply and self._pending:
+                        cmd, future = self._pending.popleft()
+                        output = "".join(f"{l}\n" for l in lines)
+                        if future.done():
+                            pass  # Caller timed out and stopped waiting
+                        elif truncated:
+                            # Let _tmux rerun this one command as a one-shot client
+                            future.set_exception(ConnectionError("tmux control output line too long"))
+                        elif parts[0] == "%end":
+                            future.set_result(output)
+                        else:
+                            future.set_exception(subprocess.CalledProcessError(1, ["tmux", cmd], "", output))
+                    block_id = None
+                else:
+                    lines.append(line)
+        except Exception:
+            pass  # Treat any read failure as the channel closing
+        finally:
+            self.is_open = False
+            if self._attached is not None and not self._attached.done():
+                self._attached.set_exception(ConnectionError("tmux control client exited during startup"))
+            while self._pending:
+                _, future = self._pending.popleft()
+                if not future.done():
+                    future.set_exception(ConnectionError("tmux control channel closed"))
+    
+    async def close(self, timeout: float = 5.0):
+        """Detach the control client, which also destroys the control session
+        
+        A client that does not exit within timeout seconds (e.g. a stopped
+        tmux server) is killed without waiting further: the server holds a
+        copy of the client's stdout, so a stopped server never delivers EOF.
+        """
+        self.is_open = False
+        if self._proc is not None and self._proc.returncode is None:
+            self._proc.stdin.close()
+            try:
+                await asyncio.wait_for(self._proc.wait(), timeout)
+            except asyncio.TimeoutError:
+                self._proc.kill()
+        if self._reader is not None:
+            try:
+                await asyncio.wait_for(self._reader, timeout)
+            except asyncio.TimeoutError:
+                pass  # wait_for has cancelled the reader
+            except Exception:
+                pass  # Shutting down; a reader failure changes nothing now
+
 class TmuxOrchestrator:
     def __init__(self):
         self.safety_mode = True
         self.max_lines_capture = 1000
+        self.max_concurrent_captures = 16
+        # Seconds to wait for any single tmux command before giving up on it
+        self.command_timeout = 5.0
+        # Targets recently confirmed by list-panes, so repeated sends skip the check
+        self._target_cache: Dict[str, float] = {}
+        self._target_ttl = 2.0
+        # (epoch second, ISO timestamp, HH:MM:SS) reused until the second changes
+        self._ts_cached: Tuple[int, str, str] = (0, "", "")
+        # Last get_tmux_sessions() result, reused by lookups that tolerate slight staleness
+        self._sessions_cache: Optional[Tuple[float, List[TmuxSession]]] = None
+        self._sessions_ttl = 0.5
+        # Set by open_control_channel(); one-shot callers keep a fork/exec per command
+        self.control: Optional[TmuxControlChannel] = None
+    
+    async def open_control_channel(self) -> bool:
+        """Route tmux commands through a persistent control-mode client"""
+        channel = TmuxControlChannel()
+        try:
+            await asyncio.wait_for(channel.start(), self.command_timeout)
+        except (OSError, ConnectionError, subprocess.CalledProcessError, asyncio.TimeoutError):
+            # Unusable (or wedged) tmux: drop the client and keep one-shot tmux calls
+            await channel.close(timeout=0)
+            return False
+        self.control = channel
+        return True
+    
+    async def close_control_channel(self):
+        """Shut down the control-mode client, if one is open"""
+        if self.control is not None:
+            await self.control.close(self.command_timeout)
+            self.control = None
+    
+    def _timestamps(self) -> Tuple[str, str]:
+        """Current time as (ISO, HH:MM:SS) at one-second granularity, formatted once per second"""
+        now = int(time.time())
+        if now != self._ts_cached[0]:
+            moment = datetime.fromtimestamp(now)
+            self._ts_cached = (now, moment.isoformat(), moment.strftime("%H:%M:%S"))
+        return self._ts_cached[1], self._ts_cached[2]
+    
+    async def _tmux(self, *args: str) -> str:
+        """Run a tmux command without blocking the event loop and return its stdout
+        
+        Raises subprocess.TimeoutExpired if tmux does not answer within
+        command_timeout, so a wedged tmux cannot stall the caller forever.
+        """
+        # Control mode reads one command per line, so multi-line arguments go via exec
+        if self.control is not None and self.control.is_open and not any('\n' in arg or '\r' in arg for arg in args):
+            try:
+                return await asyncio.wait_for(self.control.command(list(args)), self.command_timeout)
+            except asyncio.TimeoutError:
+                raise subprocess.TimeoutExpired(["tmux", *args], self.command_timeout)
+            except ConnectionError:
+                pass  # Channel went away; fall back to a one-shot tmux client
+        
+        proc = await asyncio.create_subprocess_exec(
+            "tmux", *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), self.command_timeout)
+        except asyncio.TimeoutError:
+            # Don't wait for the pipes to close: a stopped server holds a copy of
+            # the client's stdout, so they may never reach EOF
+            proc.kill()
+            raise subprocess.TimeoutExpired(["tmux", *args], self.command_timeout)
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(
+                proc.returncode, ["tmux", *args], stdout.decode(), stderr.decode()
+            )
+        return stdout.decode()
         
-    def get_tmux_sessions(self) -> List[TmuxSession]:
+    async def get_tmux_sessions(self) -> List[TmuxSession]:
         """Get all tmux sessions and their windows"""
         try:
-            # Get sessions
-            sessions_cmd = ["tmux", "list-sessions", "-F", "#{session_name}:#{session_attached}"]
-            sessions_result = subprocess.run(sessions_cmd, capture_output=True, text=True, check=True)
+            # Get every window of every session in one call and group by session.
+            # window_name goes last so a colon inside it survives the split.
+            output = await self._tmux(
+                "list-windows", "-a", "-F",
+                "#{session_name}:#{session_attached}:#{window_index}:#{window_active}:#{window_name}"
+            )
             
-            sessions = []
-            for line in sessions_result.stdout.strip().split('\n'):
+            sessions: Dict[str, TmuxSession] = {}
+            for line in output.splitlines():
                 if not line:
                     continue
-                session_name, attached = line.split(':')
-                
-                # Get windows for this session
-                windows_cmd = ["tmux", "list-windows", "-t", session_name, "-F", "#{window_index}:#{window_name}:#{window_active}"]
-                windows_result = subprocess.run(windows_cmd, capture_output=True, text=True, check=True)
+                session_name, attached, window_index, window_active, window_name = line.split(':', 4)
+                if session_name == CONTROL_SESSION_NAME:
+                    continue
                 
-                windows = []
-                for window_line in windows_result.stdout.strip().split('\n'):
-                    if not window_line:
-                        continue
-                    window_index, window_name, window_active = window_line.split(':')
-                    windows.append(TmuxWindow(
-                        session_name=session_name,
-                        window_index=int(window_index),
-                        window_name=window_name,
-                        active=window_active == '1'
-                    ))
+                session = sessions.get(session_name)
+                if session is None:
+                    session = sessions[session_name] = TmuxSession(
+                        name=session_name,
+                        windows=[],
+                        attached=attached != '0'
+                    )
                 
-                sessions.append(TmuxSession(
-                    name=session_name,
-                    windows=windows,
-                    attached=attached == '1'
+                session.windows.append(TmuxWindow(
+                    session_name=session_name,
+                    window_index=int(window_index),
+                    window_name=window_name,
+                    active=window_active == '1'
                 ))
             
-            return sessions
+            result = list(sessions.values())
+            self._sessions_cache = (time.monotonic(), result)
+            return result
         except subprocess.CalledProcessError as e:
             print(f"Error getting tmux sessions: {e}")
             return []
     
-    def capture_window_content(self, session_name: str, window_index: int, num_lines: int = 50) -> str:
+    async def capture_window_content(self, session_name: str, window_index: int, num_lines: int = 50) -> str:
         """Safely capture the last N lines from a tmux window"""
         # Validate inputs
         if not session_name or not isinstance(window_index, int) or window_index < 0:
@@ -81,174 +300,260 @@ class TmuxOrchestrator:
         target = f"{session_name}:{window_index}"
         try:
             # First check if target exists
-            check_cmd = ["tmux", "list-panes", "-t", target]
-            subprocess.run(check_cmd, capture_output=True, check=True)
+            await self._tmux("list-panes", "-t", target)
             
             # Capture the content
-            cmd = ["tmux", "capture-pane", "-t", target, "-p", "-S", f"-{num_lines}"]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return result.stdout
-        except subprocess.CalledProcessError as e:
+            return await self._tmux("capture-pane", "-t", target, "-p", "-S", f"-{num_lines}")
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            # A stuck pane reports its own error instead of failing a whole batch
             error_msg = f"Error capturing content from {target}: {e}"
             if e.stderr:
                 error_msg += f"\nDetails: {e.stderr}"
             return error_msg
     
-    def get_window_info(self, session_name: str, window_index: int) -> Dict:
+    async def get_window_info(self, session_name: str, window_index: int) -> Dict:
         """Get detailed information about a specific window"""
         try:
-            cmd = ["tmux", "display-message", "-t", f"{session_name}:{window_index}", "-p", 
-                   "#{window_name}:#{window_active}:#{window_panes}:#{window_layout}"]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            # list-panes resolves the target like display-message -t but fails on a
+            # missing window instead of falling back to the current one; every pane
+            # line carries the same window fields. window_name goes last so a colon
+            # inside it survives the split
+            output = await self._tmux(
+                "list-panes", "-t", f"{session_name}:{window_index}", "-F",
+                "#{window_active}:#{window_panes}:#{window_layout}:#{window_name}"
+            )
             
-            if result.stdout.strip():
-                parts = result.stdout.strip().split(':')
+            if output.strip():
+                active, panes, layout, name = output.splitlines()[0].split(':', 3)
                 return {
-                    "name": parts[0],
-                    "active": parts[1] == '1',
-                    "panes": int(parts[2]),
-                    "layout": parts[3],
-                    "content": self.capture_window_content(session_name, window_index)
+                    "name": name,
+                    "active": active == '1',
+                    "panes": int(panes),
+                    "layout": layout,
+                    "content": await self.capture_window_content(session_name, window_index)
                 }
         except subprocess.CalledProcessError as e:
             return {"error": f"Could not get window info: {e}"}
     
-    def send_keys_to_window(self, session_name: str, window_index: int, keys: str, confirm: bool = True) -> bool:
-        """Safely send keys to a tmux window with confirmation"""
-        # Validate inputs
+    async def _collect_window_infos(self, targets: List[Tuple[str, int]]) -> Dict[Tuple[str, int], Dict]:
+        """Get window info for many windows: one metadata query, captures run concurrently
+        
+        Targets are matched exactly against list-windows, without tmux's
+        prefix matching; use get_window_info for a user-supplied target.
+        """
+        try:
+            # window_name goes last so a colon inside it survives the split
+            output = await self._tmux(
+                "list-windows", "-a", "-F",
+                "#{session_name}:#{window_index}:#{window_active}:#{window_panes}:#{window_layout}:#{window_name}"
+            )
+        except subprocess.CalledProcessError as e:
+            return {key: {"error": f"Could not get window info: {e}"} for key in targets}
+        
+        wanted = set(targets)
+        infos: Dict[Tuple[str, int], Dict] = {}
+        for line in output.splitlines():
+            if not line:
+                continue
+            session_name, window_index, active, panes, layout, name = line.split(':', 5)
+            key = (session_name, int(window_index))
+            if key in wanted:
+                infos[key] = {
+                    "name": name,
+                    "active": active == '1',
+                    "panes": int(panes),
+                    "layout": layout
+                }
+        
+        # Capture content for every window that exists, overlapping the tmux round trips
+        semaphore = asyncio.Semaphore(self.max_concurrent_captures)
+        
+        async def capture(key: Tuple[str, int]) -> str:
+            async with semaphore:
+                return await self.capture_window_content(*key)
+        
+        contents = await asyncio.gather(*[capture(key) for key in infos])
+        for key, content in zip(infos, contents):
+            infos[key]["content"] = content
+        
+        return {
+            key: infos.get(key) or {"error": f"Could not get window info: can't find window {key[0]}:{key[1]}"}
+            for key in targets
+        }
+    
+    async def _ensure_target(self, session_name: str, window_index: int) -> Optional[str]:
+        """Validate a window target and check it exists, returning "session:index" or None"""
         if not session_name or not isinstance(window_index, int) or window_index < 0:
             print(f"Error: Invalid session name or window index: {session_name}:{window_index}")
-            return False
-            
-        if not keys:
-            print("Error: Cannot send empty keys")
-            return False
+            return None
             
-        # Check if target exists
         target = f"{session_name}:{window_index}"
-        check_cmd = ["tmux", "list-panes", "-t", target]
+        if not await self._target_exists(target):
+            print(f"Error: Tmux target '{target}' does not exist")
+            return None
+        return target
+    
+    async def _target_exists(self, target: str) -> bool:
+        """Check a target with list-panes, reusing a positive answer for _target_ttl seconds"""
+        checked_at = self._target_cache.get(target)
+        if checked_at is not None and time.monotonic() - checked_at < self._target_ttl:
+            return True
+        
         try:
-            subprocess.run(check_cmd, capture_output=True, check=True)
+            await self._tmux("list-panes", "-t", target)
         except subprocess.CalledProcessError:
-            print(f"Error: Tmux target '{target}' does not exist")
+            self._target_cache.pop(target, None)
             return False
-            
+        self._target_cache[target] = time.monotonic()
+        return True
+    
+    def _confirm_send(self, target: str, keys: str, confirm: bool) -> bool:
+        """Ask for interactive confirmation when safety mode is on"""
         if self.safety_mode and confirm:
             print(f"SAFETY CHECK: About to send '{keys}' to {target}")
             response = input("Confirm? (yes/no): ")
             if response.lower() != 'yes':
                 print("Operation cancelled")
                 return False
+        return True
+    
+    async def send_keys_to_window(self, session_name: str, window_index: int, keys: str, confirm: bool = True) -> bool:
+        """Safely send keys to a tmux window with confirmation"""
+        if not keys:
+            print("Error: Cannot send empty keys")
+            return False
+            
+        target = await self._ensure_target(session_name, window_index)
+        if target is None or not self._confirm_send(target, keys, confirm):
+            return False
         
         try:
-            cmd = ["tmux", "send-keys", "-t", target, keys]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            await self._tmux("send-keys", "-t", target, keys)
             return True
         except subprocess.CalledProcessError as e:
+            self._target_cache.pop(target, None)
             print(f"Error sending keys to {target}: {e}")
             if e.stderr:
                 print(f"Details: {e.stderr}")
             return False
     
-    def send_command_to_window(self, session_name: str, window_index: int, command: str, confirm: bool = True) -> bool:
+    async def send_command_to_window(self, session_name: str, window_index: int, command: str, confirm: bool = True) -> bool:
         """Send a command to a window (adds Enter automatically)"""
         # Validate command
         if not command:
             print("Error: Cannot send empty command")
             return False
             
-        # First send the command text
-        if not self.send_keys_to_window(session_name, window_index, command, confirm):
+        target = await self._ensure_target(session_name, window_index)
+        if target is None or not self._confirm_send(target, command, confirm):
             return False
-            
-        # Then send the actual Enter key (C-m)
-        target = f"{session_name}:{window_index}"
+        
+        # Send the command text and the Enter key in a single send-keys call
         try:
-            cmd = ["tmux", "send-keys", "-t", target, "C-m"]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            await self._tmux("send-keys", "-t", target, "--", command, "Enter")
             return True
         except subprocess.CalledProcessError as e:
-            print(f"Error sending Enter key to {target}: {e}")
+            self._target_cache.pop(target, None)
+            print(f"Error sending command to {target}: {e}")
             if e.stderr:
                 print(f"Details: {e.stderr}")
             return False
     
-    def get_all_windows_status(self) -> Dict:
+    async def get_all_windows_status(self) -> Dict:
         """Get status of all windows across all sessions"""
-        sessions = self.get_tmux_sessions()
+        sessions = await self.get_tmux_sessions()
         status = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._timestamps()[0],
             "sessions": []
         }
         
+        window_infos = await self._collect_window_infos(
+            [(session.name, window.window_index) for session in sessions for window in session.windows]
+        )
+        
         for session in sessions:
             session_data = {
                 "name": session.name,
                 "attached": session.attached,
-                "windows": []
+                "windows": [
+                    {
+                        "index": window.window_index,
+                        "name": window.window_name,
+                        "active": window.active,
+                        "info": window_infos[(session.name, window.window_index)]
+                    } for window in session.windows
+                ]
             }
             
-            for window in session.windows:
-                window_info = self.get_window_info(session.name, window.window_index)
-                window_data = {
-                    "index": window.window_index,
-                    "name": window.window_name,
-                    "active": window.active,
-                    "info": window_info
-                }
-                session_data["windows"].append(window_data)
-            
             status["sessions"].append(session_data)
         
         return status
     
-    def find_window_by_name(self, window_name: str) -> List[Tuple[str, int]]:
+    async def find_window_by_name(self, window_name: str) -> List[Tuple[str, int]]:
         """Find windows by name across all sessions"""
-        sessions = self.get_tmux_sessions()
-        matches = []
+        # Reuse a session list fetched moments ago (e.g. by get_all_windows_status)
+        cached = self._sessions_cache
+        if cached is not None and time.monotonic() - cached[0] < self._sessions_ttl:
+            sessions = cached[1]
+        else:
+            sessions = await self.get_tmux_sessions()
         
+        matches = []
+        name_lower = window_name.lower()
         for session in sessions:
             for window in session.windows:
-                if window_name.lower() in window.window_name.lower():
+                if name_lower in window.window_name.lower():
                     matches.append((session.name, window.window_index))
         
         return matches
     
-    def create_monitoring_snapshot(self) -> str:
-        """Create a comprehensive snapshot for Claude analysis"""
-        status = self.get_all_windows_status()
+    def find_window_in_status(self, status: Dict, window_name: str) -> List[Tuple[str, int]]:
+        """Find windows by name in a get_all_windows_status() result, without querying tmux"""
+        matches = []
+        name_lower = window_name.lower()
+        for session in status['sessions']:
+            for window in session['windows']:
+                if name_lower in window['name'].lower():
+                    matches.append((session['name'], window['index']))
         
-        # Format for Claude consumption
-        snapshot = f"Tmux Monitoring Snapshot - {status['timestamp']}\n"
-        snapshot += "=" * 50 + "\n\n"
+        return matches
+    
+    async def create_monitoring_snapshot(self) -> str:
+        """Create a comprehensive snapshot for Claude analysis"""
+        return self.format_monitoring_snapshot(await self.get_all_windows_status())
+    
+    def format_monitoring_snapshot(self, status: Dict) -> str:
+        """Render a get_all_windows_status() result as a text snapshot"""
+        # Format for Claude consumption; collect parts and join once at the end
+        buf = [f"Tmux Monitoring Snapshot - {status['timestamp']}\n"]
+        buf.append("=" * 50 + "\n\n")
         
         for session in status['sessions']:
-            snapshot += f"Session: {session['name']} ({'ATTACHED' if session['attached'] else 'DETACHED'})\n"
-            snapshot += "-" * 30 + "\n"
+            buf.append(f"Session: {session['name']} ({'ATTACHED' if session['attached'] else 'DETACHED'})\n")
+            buf.append("-" * 30 + "\n")
             
             for window in session['windows']:
-                snapshot += f"  Window {window['index']}: {window['name']}"
+                buf.append(f"  Window {window['index']}: {window['name']}")
                 if window['active']:
-                    snapshot += " (ACTIVE)"
-                snapshot += "\n"
+                    buf.append(" (ACTIVE)")
+                buf.append("\n")
                 
                 if 'content' in window['info']:
-                    # Get last 10 lines for overview
-                    content_lines = window['info']['content'].split('\n')
-                    recent_lines = content_lines[-10:] if len(content_lines) > 10 else content_lines
-                    snapshot += "    Recent output:\n"
+                    # Get last 10 lines for overview without splitting the whole capture
+                    recent_lines = window['info']['content'].rsplit('\n', 10)[-10:]
+                    buf.append("    Recent output:\n")
                     for line in recent_lines:
                         if line.strip():
-                            snapshot += f"    | {line}\n"
-                snapshot += "\n"
+                            buf.append(f"    | {line}\n")
+                buf.append("\n")
         
-        return snapshot
+        return "".join(buf)
     
-    def handle_status_request(self, session_name: str, window_index: int, request: str) -> bool:
+    async def handle_status_request(self, session_name: str, window_index: int, request: str) -> bool:
         """Handle STATUS REQUEST commands by providing appropriate responses"""
         try:
             # Determine role based on window name/index
-            sessions = self.get_tmux_sessions()
+            sessions = await self.get_tmux_sessions()
             session = next((s for s in sessions if s.name == session_name), None)
             if not session:
                 return False
@@ -263,12 +568,13 @@ class TmuxOrchestrator:
             
             # Send the status response to the window
             target = f"{session_name}:{window_index}"
-            cmd = ["tmux", "send-keys", "-t", target, "C-c"]  # Cancel current input
-            subprocess.run(cmd, capture_output=True, text=True)
+            try:
+                await self._tmux("send-keys", "-t", target, "C-c")  # Cancel current input
+            except subprocess.CalledProcessError:
+                pass
             
-            # Send the actual status
-            cmd = ["tmux", "send-keys", "-t", target, f"echo '{status_response}'", "C-m"]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            # Echo the shell-quoted status so apostrophes cannot break the command line
+            await self._tmux("send-keys", "-t", target, "--", f"echo {shlex.quote(status_response)}", "Enter")
             return True
             
         except subprocess.CalledProcessError as e:
@@ -277,20 +583,16 @@ class TmuxOrchestrator:
     
     def _detect_window_role(self, window_name: str, window_index: int) -> str:
         """Detect the role of a window based on its name and index"""
-        name_lower = window_name.lower()
+        match = _search_role(window_name)
+        if match:
+            return _ROLE_BY_GROUP[match.lastindex]
         
-        if 'project' in name_lower or 'manager' in name_lower or window_index == 0:
-            return 'project-manager'
-        elif 'qa' in name_lower or 'test' in name_lower or window_index == 1:
-            return 'qa-engineer'
-        elif 'dev' in name_lower or 'code' in name_lower or window_index == 2:
-            return 'developer'
-        else:
-            return 'developer'  # Default to developer
+        # No role keyword in the name; fall back to the conventional window layout
+        return _ROLE_BY_INDEX.get(window_index, 'developer')  # Default to developer
     
     def _generate_status_response(self, role: str, session_name: str, window_index: int) -> str:
         """Generate appropriate status response based on role"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = self._timestamps()[1]
         
         if role == 'project-manager':
             return f"[{timestamp}] PROJECT STATUS: Coordinating team activities. Monitoring QA and development progress. Ready to assist with project management tasks."
@@ -304,12 +606,12 @@ class TmuxOrchestrator:
 if __name__ == "__main__":
     try:
         # Check if tmux is available
-        subprocess.run(["tmux", "-V"], capture_output=True, check=True)
+        subprocess.run(["tmux", "-V"], capture_output=True, check=True, timeout=5)
         
         orchestrator = TmuxOrchestrator()
-        status = orchestrator.get_all_windows_status()
+        status = asyncio.run(orchestrator.get_all_windows_status())
         print(json.dumps(status, indent=2))
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
         print("Error: tmux is not installed or not accessible")
         print("Please install tmux to use this utility")
         exit(1)
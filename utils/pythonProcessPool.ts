@@ -132,18 +132,10 @@ export class PythonProcessPool extends EventEmitter {
                 busy: false,
             };
             
-            // Set up stdout handler
-            let buffer = '';
-            pythonProcess.stdout.on('data', (data) => {
-                buffer += data.toString();
-                const lines = buffer.split('\n');
-                buffer = lines.pop() || '';
-                
-                for (const line of lines) {
-                    if (line.trim()) {
-                        this.handleResponse(connection, line);
-                    }
-                }
+            // Set up stdout handler (responses are Content-Length framed)
+            let buffer = Buffer.alloc(0);
+            pythonProcess.stdout.on('data', (data: Buffer) => {
+                buffer = this.drainFrames(connection, Buffer.concat([buffer, data]));
             });
             
             // Set up stderr handler
@@ -182,6 +174,61 @@ export class PythonProcessPool extends EventEmitter {
         }
     }
 
+    /**
+     * Dispatch every complete "Content-Length: N\r\n\r\n<body>" frame in the
+     * buffer and return the unconsumed remainder
+     */
+    private drainFrames(connection: PythonConnection, buffer: Buffer): Buffer {
+        while (true) {
+            const start = buffer.indexOf('Content-Length:');
+            if (start === -1) {
+                // Keep a possible partial header; report complete stray lines
+                const lastNewline = buffer.lastIndexOf('\n');
+                if (lastNewline !== -1) {
+                    this.logStrayOutput(connection, buffer.subarray(0, lastNewline + 1));
+                    buffer = buffer.subarray(lastNewline + 1);
+                }
+                return buffer;
+            }
+            if (start > 0) {
+                this.logStrayOutput(connection, buffer.subarray(0, start));
+                buffer = buffer.subarray(start);
+            }
+            
+            const headerEnd = buffer.indexOf('\r\n\r\n');
+            if (headerEnd === -1) {
+                return buffer;
+            }
+            
+            const match = /^Content-Length:\s*(\d+)/.exec(buffer.subarray(0, headerEnd).toString());
+            if (!match) {
+                // Malformed header; drop it and resynchronise on the next one
+                this.logStrayOutput(connection, buffer.subarray(0, headerEnd + 4));
+                buffer = buffer.subarray(headerEnd + 4);
+                continue;
+            }
+            
+            const bodyStart = headerEnd + 4;
+            const bodyEnd = bodyStart + parseInt(match[1], 10);
+            if (buffer.length < bodyEnd) {
+                return buffer;
+            }
+            
+            this.handleResponse(connection, buffer.subarray(bodyStart, bodyEnd).toString('utf8'));
+            buffer = buffer.subarray(bodyEnd);
+        }
+    }
+
+    /**
+     * Log unframed output (e.g. diagnostics printed by the Python side)
+     */
+    private logStrayOutput(connection: PythonConnection, output: Buffer): void {
+        const text = output.toString().trim();
+        if (text) {
+            console.warn(`Python process ${connection.id} output:`, text);
+        }
+    }
+
     /**
      * Handle response from Python process
      */
@@ -306,7 +353,9 @@ export class PythonProcessPool extends EventEmitter {
             connection.busy = true;
             
             // Send request
-            connection.process.stdin.write(JSON.stringify(request) + '\n');
+            const body = Buffer.from(JSON.stringify(request), 'utf8');
+            connection.process.stdin.write(`Content-Length: ${body.length}\r\n\r\n`);
+            connection.process.stdin.write(body);
         });
     }
 
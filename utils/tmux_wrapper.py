@@ -3,19 +3,194 @@
 import sys
 import json
 import os
-import subprocess
-import argparse
+import threading
+import time
+
+try:
+    import orjson  # Optional: much faster encoding for large status responses
+except ImportError:
+    orjson = None
 
 # Dynamically resolve the path to tmux_utils
 script_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(script_dir)
 sys.path.insert(0, parent_dir)
-from scripts.tmux_utils import TmuxOrchestrator
+
+class FramingError(ValueError):
+    """A persistent-mode message whose Content-Length framing is unusable"""
 
 class PersistentTmuxWrapper:
     def __init__(self):
-        self.orchestrator = TmuxOrchestrator()
-        self.orchestrator.safety_mode = False  # Disable interactive confirmations
+        # The orchestrator (and asyncio with it) is loaded on first use, so a
+        # one-shot process that only answers ping never imports tmux_utils
+        self._orchestrator = None
+        self._loop = None
+        # Set in persistent mode: open a tmux control-mode client with the orchestrator
+        self._use_control_channel = False
+        # Stale-while-revalidate cache for polled read-only methods:
+        # method -> (monotonic fetch time, result). Entries younger than
+        # _cache_soft_ttl are served as-is; up to _cache_ttl they are served
+        # while a background thread refreshes them; older ones are refetched.
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0  # Bumped on invalidation so in-flight refreshes are dropped
+        self._refreshing = set()
+        self._cache_soft_ttl = 0.5
+        self._cache_ttl = 2.0
+        # Persistent-mode framing: Content-Length headers, or one JSON object per line
+        self.legacy_framing = False
+
+    @property
+    def orchestrator(self):
+        return self._get_orchestrator()
+
+    def _get_orchestrator(self):
+        """Import and create the TmuxOrchestrator the first time it is needed"""
+        if self._orchestrator is None:
+            self._orchestrator = self._new_orchestrator()
+            if self._use_control_channel:
+                # If it cannot be opened the orchestrator falls back to a tmux
+                # subprocess per command
+                self._run(self._orchestrator.open_control_channel())
+        return self._orchestrator
+
+    def _new_orchestrator(self):
+        from scripts.tmux_utils import TmuxOrchestrator
+        orchestrator = TmuxOrchestrator()
+        orchestrator.safety_mode = False  # Disable interactive confirmations
+        return orchestrator
+
+    def _run(self, coro):
+        """Run an orchestrator coroutine to completion from synchronous code"""
+        if self._loop is None:
+            import asyncio
+            # One event loop for the wrapper's lifetime; requests are served one at a time
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def _cached(self, key, fetch):
+        """Return fetch(orchestrator) for key, served from the response cache when fresh enough"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            generation = self._cache_generation
+        
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age < self._cache_soft_ttl:
+                return entry[1]
+            if age < self._cache_ttl:
+                self._refresh_in_background(key, fetch)
+                return entry[1]
+        
+        fetched_at = time.monotonic()
+        result = self._run(fetch(self.orchestrator))
+        self._store_cached(key, fetched_at, result, generation)
+        return result
+
+    def _store_cached(self, key, fetched_at, result, generation):
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                self._cache[key] = (fetched_at, result)
+
+    def _refresh_in_background(self, key, fetch):
+        """Refetch key on a daemon thread; at most one refresh per key at a time"""
+        with self._cache_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            generation = self._cache_generation
+        
+        def refresh():
+            import asyncio
+            try:
+                # The thread gets its own orchestrator and event loop; the main
+                # one's control channel is bound to the main thread's loop
+                fetched_at = time.monotonic()
+                result = asyncio.run(fetch(self._new_orchestrator()))
+                self._store_cached(key, fetched_at, result, generation)
+            except Exception:
+                pass  # Keep serving the old entry until it expires
+            finally:
+                with self._cache_lock:
+                    self._refreshing.discard(key)
+        
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _fresh_cached(self, key):
+        """Return the cached result for key if it is within the soft TTL, else None"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self._cache_soft_ttl:
+            return entry[1]
+        return None
+
+    def _invalidate_cache(self):
+        """Drop cached responses after a request that changes window state"""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_generation += 1
+        if self._orchestrator is not None:
+            self._orchestrator._sessions_cache = None
+
+    def _read_message(self):
+        """Read one request body from stdin, or return None at EOF
+        
+        Messages are framed LSP-style as "Content-Length: N\\r\\n\\r\\n" followed by
+        N bytes of JSON, or one JSON object per line with legacy framing.
+        Raises FramingError for a header block without a usable length; the
+        header lines have been consumed, so the next call starts afresh.
+        """
+        stdin = sys.stdin.buffer
+        if self.legacy_framing:
+            line = stdin.readline()
+            return line.strip() if line else None
+        
+        headers = []
+        while True:
+            line = stdin.readline()
+            if not line:
+                return None  # EOF reached
+            line = line.strip()
+            if not line:
+                if not headers:
+                    continue  # Skip blank lines between messages
+                break  # End of the header block
+            if not headers and line.startswith(b"{"):
+                # Unframed JSON: an old newline-delimited client, or the unread
+                # body of a frame rejected earlier. Resync on a header glued to
+                # its end, if any; otherwise report the line.
+                marker = line.lower().find(b"content-length:")
+                if marker == -1:
+                    raise FramingError(
+                        "expected a Content-Length header "
+                        "(newline-delimited JSON needs --legacy-framing)"
+                    )
+                line = line[marker:]
+            headers.append(line)
+        
+        length = None
+        for header in headers:
+            name, _, value = header.partition(b":")
+            if name.strip().lower() == b"content-length":
+                value = value.strip()
+                if not value.isdigit():
+                    raise FramingError(f"invalid Content-Length: {value.decode(errors='replace')!r}")
+                length = int(value)
+        if length is None:
+            raise FramingError("missing Content-Length header")
+        
+        body = stdin.read(length)
+        return body if len(body) == length else None
+
+    def _write_response(self, response):
+        """Write one framed JSON response to stdout, using orjson when available"""
+        data = orjson.dumps(response) if orjson is not None else json.dumps(response).encode()
+        sys.stdout.flush()  # Keep any pending print() output ahead of the response
+        if self.legacy_framing:
+            sys.stdout.buffer.write(data + b"\n")
+        else:
+            sys.stdout.buffer.write(b"Content-Length: %d\r\n\r\n" % len(data) + data)
+        sys.stdout.buffer.flush()
 
     def handle_request(self, request):
         """Handle a single JSON-RPC style request"""
@@ -28,7 +203,7 @@ class PersistentTmuxWrapper:
             if method == 'ping':
                 result = 'pong'
             elif method == 'get_tmux_sessions':
-                sessions = self.orchestrator.get_tmux_sessions()
+                sessions = self._run(self.orchestrator.get_tmux_sessions())
                 result = []
                 for session in sessions:
                     result.append({
@@ -49,13 +224,13 @@ class PersistentTmuxWrapper:
                 session_name = args[0]
                 window_index = args[1]
                 num_lines = args[2] if len(args) > 2 else 50
-                result = self.orchestrator.capture_window_content(session_name, window_index, num_lines)
+                result = self._run(self.orchestrator.capture_window_content(session_name, window_index, num_lines))
             elif method == 'get_window_info':
                 if len(args) < 2:
                     raise ValueError("Missing arguments for get_window_info")
                 session_name = args[0]
                 window_index = args[1]
-                result = self.orchestrator.get_window_info(session_name, window_index)
+                result = self._run(self.orchestrator.get_window_info(session_name, window_index))
             elif method == 'send_keys_to_window':
                 if len(args) < 3:
                     raise ValueError("Missing arguments for send_keys_to_window")
@@ -63,7 +238,8 @@ class PersistentTmuxWrapper:
                 window_index = args[1]
                 keys = args[2]
                 confirm = args[3] if len(args) > 3 else False
-                result = self.orchestrator.send_keys_to_window(session_name, window_index, keys, confirm)
+                result = self._run(self.orchestrator.send_keys_to_window(session_name, window_index, keys, confirm))
+                self._invalidate_cache()
             elif method == 'send_command_to_window':
                 if len(args) < 3:
                     raise ValueError("Missing arguments for send_command_to_window")
@@ -74,18 +250,25 @@ class PersistentTmuxWrapper:
                 
                 # Handle STATUS REQUEST commands by converting them to proper status responses
                 if command.startswith('STATUS REQUEST:'):
-                    result = self.orchestrator.handle_status_request(session_name, window_index, command)
+                    result = self._run(self.orchestrator.handle_status_request(session_name, window_index, command))
                 else:
-                    result = self.orchestrator.send_command_to_window(session_name, window_index, command, confirm)
+                    result = self._run(self.orchestrator.send_command_to_window(session_name, window_index, command, confirm))
+                self._invalidate_cache()
             elif method == 'get_all_windows_status':
-                result = self.orchestrator.get_all_windows_status()
+                result = self._cached('get_all_windows_status', lambda o: o.get_all_windows_status())
             elif method == 'find_window_by_name':
                 if len(args) < 1:
                     raise ValueError("Missing window name argument")
                 window_name = args[0]
-                result = self.orchestrator.find_window_by_name(window_name)
+                # Scan a status snapshot from a moment ago instead of asking tmux again
+                status = self._fresh_cached('get_all_windows_status')
+                if status is not None:
+                    result = self.orchestrator.find_window_in_status(status, window_name)
+                else:
+                    result = self._run(self.orchestrator.find_window_by_name(window_name))
             elif method == 'create_monitoring_snapshot':
-                result = self.orchestrator.create_monitoring_snapshot()
+                status = self._cached('get_all_windows_status', lambda o: o.get_all_windows_status())
+                result = self.orchestrator.format_monitoring_snapshot(status)
             else:
                 raise ValueError(f"Unknown method: {method}")
 
@@ -100,44 +283,50 @@ class PersistentTmuxWrapper:
                 'error': str(e)
             }
 
-    def run_persistent(self):
+    def run_persistent(self, legacy_framing=False):
         """Run in persistent mode, handling JSON-RPC requests over stdin/stdout"""
+        self.legacy_framing = legacy_framing
+        # Keep one tmux control-mode client for the whole session. It is opened
+        # with the orchestrator on the first tmux request, so ping never waits on tmux
+        self._use_control_channel = True
         try:
             while True:
                 try:
-                    # Read line from stdin
-                    line = sys.stdin.readline()
-                    if not line:
+                    # Read the next request from stdin
+                    message = self._read_message()
+                    if message is None:
                         break  # EOF reached
                     
-                    line = line.strip()
-                    if not line:
+                    if not message:
                         continue  # Skip empty lines
                     
                     # Parse JSON request
-                    request = json.loads(line)
+                    request = orjson.loads(message) if orjson is not None else json.loads(message)
                     
                     # Handle request
                     response = self.handle_request(request)
                     
                     # Send response
-                    print(json.dumps(response))
-                    sys.stdout.flush()
+                    self._write_response(response)
                     
                 except json.JSONDecodeError as e:
                     error_response = {
                         'id': None,
                         'error': f'Invalid JSON request: {str(e)}'
                     }
-                    print(json.dumps(error_response))
-                    sys.stdout.flush()
+                    self._write_response(error_response)
+                except FramingError as e:
+                    error_response = {
+                        'id': None,
+                        'error': f'Invalid request framing: {str(e)}'
+                    }
+                    self._write_response(error_response)
                 except Exception as e:
                     error_response = {
                         'id': None,
                         'error': f'Request handling error: {str(e)}'
                     }
-                    print(json.dumps(error_response))
-                    sys.stdout.flush()
+                    self._write_response(error_response)
                     
         except KeyboardInterrupt:
             sys.exit(0)
@@ -146,8 +335,11 @@ class PersistentTmuxWrapper:
                 'id': None,
                 'error': f'Persistent mode error: {str(e)}'
             }
-            print(json.dumps(error_response))
+            self._write_response(error_response)
             sys.exit(1)
+        finally:
+            if self._orchestrator is not None:
+                self._run(self._orchestrator.close_control_channel())
 
     def run_legacy(self, method, args):
         """Run in legacy mode for backward compatibility"""
@@ -165,32 +357,42 @@ class PersistentTmuxWrapper:
         else:
             print(json.dumps(response['result']))
 
-def main():
+def print_help():
+    """Print usage; argparse is only imported here so normal calls skip its import cost"""
+    import argparse
     parser = argparse.ArgumentParser(description='Tmux Wrapper for Node.js Bridge')
     parser.add_argument('--persistent', action='store_true', 
                         help='Run in persistent mode for connection pooling')
+    parser.add_argument('--legacy-framing', action='store_true', 
+                        help='In persistent mode, use one JSON object per line instead of Content-Length framing')
     parser.add_argument('method', nargs='?', 
                         help='Method to execute (for legacy mode)')
     parser.add_argument('args', nargs='*', 
-                        help='Arguments for the method')
+                        help='Arguments for the method (JSON-encoded)')
+    parser.print_help()
+
+def main():
+    argv = sys.argv[1:]
+    if argv[:1] in (['-h'], ['--help']):
+        print_help()
+        return
     
-    args = parser.parse_args()
     wrapper = PersistentTmuxWrapper()
     
-    if args.persistent:
+    if '--persistent' in argv:
         # Run in persistent mode for connection pooling
-        wrapper.run_persistent()
+        wrapper.run_persistent(legacy_framing='--legacy-framing' in argv)
     else:
         # Legacy mode for backward compatibility
-        if not args.method:
+        if not argv:
             print(json.dumps({"error": "No method specified"}))
             sys.exit(1)
         
-        method = args.method
+        method = argv[0]
         method_args = []
         
         # Parse arguments
-        for arg in args.args:
+        for arg in argv[1:]:
             try:
                 method_args.append(json.loads(arg))
             except json.JSONDecodeError: